@@ -0,0 +1,280 @@
+import pulumi
+import pulumi_aws as aws
+from pulumi import Config, Output, export
+import json
+
+# Pulumi Configurations
+config = Config()
+log_prefix = config.get("alb_log_prefix") or "alb"
+log_retention_days = config.get_int("alb_log_retention_days") or 30
+athena_results_retention_days = config.get_int("athena_results_retention_days") or 7
+projection_start_date = config.get("alb_log_projection_start") or "2024/01/01"
+
+# Account and region the ALB writes its logs from
+caller_identity = aws.get_caller_identity()
+region = aws.get_region().name
+elb_service_account = aws.elb.get_service_account()
+
+# S3 Bucket for ALB Access Logs
+alb_logs_bucket = aws.s3.BucketV2(
+    "albAccessLogsBucket",
+    force_destroy=True,
+    tags={"Name": "albAccessLogsBucket"},
+)
+
+# Block all public access to the log bucket
+aws.s3.BucketPublicAccessBlock(
+    "albAccessLogsPublicAccessBlock",
+    bucket=alb_logs_bucket.id,
+    block_public_acls=True,
+    ignore_public_acls=True,
+    block_public_policy=True,
+    restrict_public_buckets=True,
+)
+
+# Default encryption (ALB log delivery only supports SSE-S3, not KMS)
+aws.s3.BucketServerSideEncryptionConfigurationV2(
+    "albAccessLogsEncryption",
+    bucket=alb_logs_bucket.id,
+    rules=[
+        aws.s3.BucketServerSideEncryptionConfigurationV2RuleArgs(
+            apply_server_side_encryption_by_default=aws.s3.BucketServerSideEncryptionConfigurationV2RuleApplyServerSideEncryptionByDefaultArgs(
+                sse_algorithm="AES256",
+            ),
+        )
+    ],
+)
+
+# Expire raw logs and Athena query results so the bucket does not grow unbounded
+aws.s3.BucketLifecycleConfigurationV2(
+    "albAccessLogsLifecycle",
+    bucket=alb_logs_bucket.id,
+    rules=[
+        aws.s3.BucketLifecycleConfigurationV2RuleArgs(
+            id="expire-alb-logs",
+            status="Enabled",
+            filter=aws.s3.BucketLifecycleConfigurationV2RuleFilterArgs(prefix=f"{log_prefix}/"),
+            expiration=aws.s3.BucketLifecycleConfigurationV2RuleExpirationArgs(days=log_retention_days),
+        ),
+        aws.s3.BucketLifecycleConfigurationV2RuleArgs(
+            id="expire-athena-results",
+            status="Enabled",
+            filter=aws.s3.BucketLifecycleConfigurationV2RuleFilterArgs(prefix="athena-results/"),
+            expiration=aws.s3.BucketLifecycleConfigurationV2RuleExpirationArgs(days=athena_results_retention_days),
+        ),
+    ],
+)
+
+# Allow the regional ELB account to deliver access logs into the bucket
+alb_logs_bucket_policy = aws.s3.BucketPolicy(
+    "albAccessLogsBucketPolicy",
+    bucket=alb_logs_bucket.id,
+    policy=alb_logs_bucket.arn.apply(lambda arn: json.dumps({
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Sid": "AllowElbLogDelivery",
+                "Effect": "Allow",
+                "Principal": {"AWS": elb_service_account.arn},
+                "Action": "s3:PutObject",
+                "Resource": f"{arn}/{log_prefix}/AWSLogs/{caller_identity.account_id}/*",
+            },
+            {
+                "Sid": "DenyInsecureTransport",
+                "Effect": "Deny",
+                "Principal": "*",
+                "Action": "s3:*",
+                "Resource": [arn, f"{arn}/*"],
+                "Condition": {"Bool": {"aws:SecureTransport": "false"}},
+            },
+        ],
+    })),
+)
+
+# Glue Database for Athena
+alb_logs_database = aws.glue.CatalogDatabase(
+    "albAccessLogsDatabase",
+    name="alb_access_logs",
+    description="ALB access logs for per-request latency analysis",
+)
+
+# Glue Table over the raw ALB logs, partitioned by day using partition projection
+alb_log_columns = [
+    ("type", "string"),
+    ("time", "string"),
+    ("elb", "string"),
+    ("client_ip", "string"),
+    ("client_port", "int"),
+    ("target_ip", "string"),
+    ("target_port", "int"),
+    ("request_processing_time", "double"),
+    ("target_processing_time", "double"),
+    ("response_processing_time", "double"),
+    ("elb_status_code", "int"),
+    ("target_status_code", "string"),
+    ("received_bytes", "bigint"),
+    ("sent_bytes", "bigint"),
+    ("request_verb", "string"),
+    ("request_url", "string"),
+    ("request_proto", "string"),
+    ("user_agent", "string"),
+    ("ssl_cipher", "string"),
+    ("ssl_protocol", "string"),
+    ("target_group_arn", "string"),
+    ("trace_id", "string"),
+    ("domain_name", "string"),
+    ("chosen_cert_arn", "string"),
+    ("matched_rule_priority", "string"),
+    ("request_creation_time", "string"),
+    ("actions_executed", "string"),
+    ("redirect_url", "string"),
+    ("lambda_error_reason", "string"),
+    ("target_port_list", "string"),
+    ("target_status_code_list", "string"),
+    ("classification", "string"),
+    ("classification_reason", "string"),
+    ("conn_trace_id", "string"),
+]
+
+# One capture group per column above, in the same order
+alb_log_regex = (
+    '([^ ]*) ([^ ]*) ([^ ]*) ([^ ]*):([0-9]*) ([^ ]*)[:-]([0-9]*) ([-.0-9]*) ([-.0-9]*) ([-.0-9]*) '
+    '(|[-0-9]*) (-|[-0-9]*) ([-0-9]*) ([-0-9]*) "([^ ]*) (.*) (- |[^ ]*)" "([^"]*)" ([A-Z0-9-_]+) '
+    '([A-Za-z0-9.-]*) ([^ ]*) "([^"]*)" "([^"]*)" "([^"]*)" ([-.0-9]*) ([^ ]*) "([^"]*)" "([^"]*)" '
+    '"([^ ]*)" "([^ ]+?)" "([^ ]+)" "([^ ]*)" "([^ ]*)" ?([^ ]*)?'
+)
+
+alb_logs_location = Output.concat(
+    "s3://", alb_logs_bucket.bucket, f"/{log_prefix}/AWSLogs/{caller_identity.account_id}/elasticloadbalancing/{region}"
+)
+
+alb_logs_table = aws.glue.CatalogTable(
+    "albAccessLogsTable",
+    name="alb_logs",
+    database_name=alb_logs_database.name,
+    table_type="EXTERNAL_TABLE",
+    parameters={
+        "EXTERNAL": "TRUE",
+        "projection.enabled": "true",
+        "projection.day.type": "date",
+        "projection.day.range": f"{projection_start_date},NOW",
+        "projection.day.format": "yyyy/MM/dd",
+        "projection.day.interval": "1",
+        "projection.day.interval.unit": "DAYS",
+        "storage.location.template": alb_logs_location.apply(lambda location: location + "/${day}"),
+    },
+    partition_keys=[
+        aws.glue.CatalogTablePartitionKeyArgs(name="day", type="string"),
+    ],
+    storage_descriptor=aws.glue.CatalogTableStorageDescriptorArgs(
+        location=alb_logs_location,
+        input_format="org.apache.hadoop.mapred.TextInputFormat",
+        output_format="org.apache.hadoop.hive.ql.io.HiveIgnoreKeyTextOutputFormat",
+        ser_de_info=aws.glue.CatalogTableStorageDescriptorSerDeInfoArgs(
+            serialization_library="org.apache.hadoop.hive.serde2.RegexSerDe",
+            parameters={
+                "serialization.format": "1",
+                "input.regex": alb_log_regex,
+            },
+        ),
+        columns=[
+            aws.glue.CatalogTableStorageDescriptorColumnArgs(name=name, type=column_type)
+            for name, column_type in alb_log_columns
+        ],
+    ),
+)
+
+# Athena Workgroup writing encrypted results into the log bucket
+athena_workgroup = aws.athena.Workgroup(
+    "albLatencyWorkgroup",
+    name="alb-latency",
+    force_destroy=True,
+    configuration=aws.athena.WorkgroupConfigurationArgs(
+        enforce_workgroup_configuration=True,
+        publish_cloudwatch_metrics_enabled=True,
+        result_configuration=aws.athena.WorkgroupConfigurationResultConfigurationArgs(
+            output_location=Output.concat("s3://", alb_logs_bucket.bucket, "/athena-results/"),
+            encryption_configuration=aws.athena.WorkgroupConfigurationResultConfigurationEncryptionConfigurationArgs(
+                encryption_option="SSE_S3",
+            ),
+        ),
+    ),
+    tags={"Name": "albLatencyWorkgroup"},
+)
+
+# Saved Queries over the last 24 hours. The `day` predicate prunes partitions to
+# yesterday and today; the `time` predicate trims that to 24h.
+# target_processing_time is -1 when no target responded.
+named_queries = {
+    "albP99LatencyByPath": (
+        "p99 latency per path",
+        """
+        SELECT url_extract_path(request_url) AS path,
+               count(*) AS requests,
+               approx_percentile(request_processing_time, 0.99) AS p99_request_processing,
+               approx_percentile(target_processing_time, 0.99) AS p99_target_processing,
+               approx_percentile(response_processing_time, 0.99) AS p99_response_processing
+        FROM alb_logs
+        WHERE day >= date_format(current_date - interval '1' day, '%Y/%m/%d')
+          AND from_iso8601_timestamp(time) > now() - interval '24' hour
+          AND target_processing_time >= 0
+        GROUP BY 1
+        ORDER BY p99_target_processing DESC
+        LIMIT 50
+        """,
+    ),
+    "albSlowestTargets": (
+        "Slowest targets",
+        """
+        SELECT target_ip || ':' || cast(target_port AS varchar) AS target,
+               count(*) AS requests,
+               avg(target_processing_time) AS avg_target_processing,
+               approx_percentile(target_processing_time, 0.5) AS p50_target_processing,
+               approx_percentile(target_processing_time, 0.99) AS p99_target_processing,
+               max(target_processing_time) AS max_target_processing
+        FROM alb_logs
+        WHERE day >= date_format(current_date - interval '1' day, '%Y/%m/%d')
+          AND from_iso8601_timestamp(time) > now() - interval '24' hour
+          AND target_processing_time >= 0
+        GROUP BY 1
+        ORDER BY p99_target_processing DESC
+        LIMIT 25
+        """,
+    ),
+    "alb5xxHotspots": (
+        "5xx hotspots",
+        """
+        SELECT url_extract_path(request_url) AS path,
+               target_ip,
+               elb_status_code,
+               target_status_code,
+               count(*) AS errors
+        FROM alb_logs
+        WHERE day >= date_format(current_date - interval '1' day, '%Y/%m/%d')
+          AND from_iso8601_timestamp(time) > now() - interval '24' hour
+          AND elb_status_code >= 500
+        GROUP BY 1, 2, 3, 4
+        ORDER BY errors DESC
+        LIMIT 50
+        """,
+    ),
+}
+
+for resource_name, (description, query) in named_queries.items():
+    aws.athena.NamedQuery(
+        resource_name,
+        name=description,
+        description=description,
+        database=alb_logs_database.name,
+        workgroup=athena_workgroup.name,
+        query=query.strip(),
+    )
+
+# Make outputs accessible as Python variables
+alb_logs_bucket_name = alb_logs_bucket.bucket
+alb_logs_prefix = log_prefix
+
+# Export Outputs
+export("alb_access_logs_bucket", alb_logs_bucket.bucket)
+export("alb_access_logs_athena_table", Output.concat(alb_logs_database.name, ".", alb_logs_table.name))
+export("alb_access_logs_athena_workgroup", athena_workgroup.name)
@@ -0,0 +1,123 @@
+import pulumi
+import pulumi_aws as aws
+from pulumi import Config, Output, export
+import hashlib
+import os
+
+# Pulumi Configurations
+config = Config()
+# Map of object name -> local path for the ELK bootstrap assets.
+# Unset, it picks up ./setup.sh if present; setup.sh is not checked in, so without it
+# the ELK node boots without running a bootstrap and the rest of the program still deploys.
+bootstrap_assets = config.get_object("elk_bootstrap_assets")
+if bootstrap_assets is None:
+    bootstrap_assets = {"setup.sh": "setup.sh"} if os.path.exists("setup.sh") else {}
+    if not bootstrap_assets:
+        pulumi.log.warn(
+            "setup.sh not found and 'elk_bootstrap_assets' is not set; the ELK node will not be bootstrapped."
+        )
+bootstrap_entrypoint = config.get("elk_bootstrap_entrypoint") or "setup.sh"
+tags = {"Environment": "dev", "Project": "monitoring-layer"}
+
+if bootstrap_assets and bootstrap_entrypoint not in bootstrap_assets:
+    raise ValueError(
+        f"elk_bootstrap_entrypoint '{bootstrap_entrypoint}' is not one of the 'elk_bootstrap_assets' keys: "
+        f"{', '.join(sorted(bootstrap_assets))}"
+    )
+
+
+def content_hash(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file, read in chunks so large artifacts are not loaded whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# S3 Bucket for ELK Bootstrap Assets (replaces the out-of-band upload.sh bucket)
+assets_bucket = aws.s3.BucketV2(
+    "elkAssetsBucket",
+    force_destroy=True,
+    tags={**tags, "Name": "elkAssetsBucket"},
+)
+
+aws.s3.BucketPublicAccessBlock(
+    "elkAssetsPublicAccessBlock",
+    bucket=assets_bucket.id,
+    block_public_acls=True,
+    ignore_public_acls=True,
+    block_public_policy=True,
+    restrict_public_buckets=True,
+)
+
+aws.s3.BucketServerSideEncryptionConfigurationV2(
+    "elkAssetsEncryption",
+    bucket=assets_bucket.id,
+    rules=[
+        aws.s3.BucketServerSideEncryptionConfigurationV2RuleArgs(
+            apply_server_side_encryption_by_default=aws.s3.BucketServerSideEncryptionConfigurationV2RuleApplyServerSideEncryptionByDefaultArgs(
+                sse_algorithm="AES256",
+            ),
+        )
+    ],
+)
+
+# Content-addressed Bucket Objects: the key embeds the file hash, so an unchanged
+# file produces no diff (and no upload), while a changed file gets a new key.
+# The provider switches to multipart uploads for large objects on its own.
+asset_hashes = {}
+asset_keys = {}
+missing_assets = [path for path in bootstrap_assets.values() if not os.path.exists(path)]
+if missing_assets:
+    raise FileNotFoundError(
+        f"ELK bootstrap asset(s) not found: {', '.join(sorted(missing_assets))}. "
+        "Add the file(s) or point the 'elk_bootstrap_assets' config key at existing paths."
+    )
+
+for name, path in sorted(bootstrap_assets.items()):
+    asset_hashes[name] = content_hash(path)
+    key = f"bootstrap/{asset_hashes[name][:16]}/{name}"
+    asset_object = aws.s3.BucketObjectv2(
+        f"elkAsset-{name}",
+        bucket=assets_bucket.id,
+        key=key,
+        source=pulumi.FileAsset(path),
+        server_side_encryption="AES256",
+        tags={**tags, "ContentSha256": asset_hashes[name]},
+    )
+    asset_keys[name] = asset_object.key
+
+# Combined hash of every asset, used to roll the ELK node when any of them changes
+bootstrap_hash = hashlib.sha256(
+    "".join(f"{name}={digest}\n" for name, digest in sorted(asset_hashes.items())).encode()
+).hexdigest()
+
+
+def _render_bootstrap_commands(bucket, keys):
+    if not keys:
+        return ""
+    entrypoint = os.path.basename(bootstrap_entrypoint)
+    lines = [f"# bootstrap-hash: {bootstrap_hash}", "mkdir -p /tmp/elk-bootstrap"]
+    for name, key in sorted(keys.items()):
+        lines.append(f"aws s3 cp s3://{bucket}/{key} /tmp/elk-bootstrap/{os.path.basename(name)}")
+    lines += [
+        f"chmod +x /tmp/elk-bootstrap/{entrypoint}",
+        "sleep 60",
+        f"/tmp/elk-bootstrap/{entrypoint}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+# Shell commands that fetch and run the bootstrap assets; they change whenever an asset hash changes
+bootstrap_commands = Output.all(assets_bucket.bucket, asset_keys).apply(
+    lambda args: _render_bootstrap_commands(args[0], args[1])
+)
+
+# Make outputs accessible as Python variables
+assets_bucket_name = assets_bucket.bucket
+assets_bucket_arn = assets_bucket.arn
+
+# Export Outputs
+export("elk_assets_bucket", assets_bucket.bucket)
+export("elk_bootstrap_hash", bootstrap_hash)
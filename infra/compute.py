@@ -1,10 +1,11 @@
-from pulumi import export
+from pulumi import export, Config, ResourceOptions
 import pulumi_aws as aws
 import json
 
 # Import network and security outputs dynamically
 from infra import network
 from infra import security
+from infra import access_logs
 
 # Retrieve network outputs dynamically
 vpc_id = network.vpc_id
@@ -14,6 +15,23 @@ public_sg_id = network.public_sg_id
 
 # Retrieve IAM role ARN from security.py
 ecs_task_execution_role_arn = security.ecs_task_execution_role_arn
+ecs_task_role_arn = security.ecs_task_role_arn
+
+# Pulumi Configurations
+config = Config()
+app_task_cpu = config.get_int("app_task_cpu") or 256
+app_task_memory = config.get_int("app_task_memory") or 512
+tracing_enabled = config.get_bool("tracing_enabled") or False
+adot_image = config.get("adot_image") or "public.ecr.aws/aws-observability/aws-otel-collector:v0.41.1"
+adot_cpu = config.get_int("adot_cpu")  # Carved out of the task CPU budget; 0 lets the sidecar share unreserved CPU
+adot_cpu = 64 if adot_cpu is None else adot_cpu
+adot_memory = config.get_int("adot_memory") or 128  # Carved out of the task memory budget
+tracing_decision_wait_s = config.get_int("tracing_decision_wait_s") or 10
+tracing_num_traces = config.get_int("tracing_num_traces") or 10000
+tracing_latency_threshold_ms = config.get_int("tracing_latency_threshold_ms")
+tracing_latency_threshold_ms = 500 if tracing_latency_threshold_ms is None else tracing_latency_threshold_ms
+tracing_sampling_percentage = config.get_float("tracing_sampling_percentage")  # 0 keeps only error and slow traces
+tracing_sampling_percentage = 5.0 if tracing_sampling_percentage is None else tracing_sampling_percentage
 
 # ECS Task Security Group
 ecs_task_sg = aws.ec2.SecurityGroup(
@@ -52,7 +70,13 @@ alb = aws.lb.LoadBalancer(
     security_groups=[public_sg_id],  # Use Public SG for ALB
     subnets=public_subnets,  # Use public subnets for ALB
     load_balancer_type="application",
+    access_logs=aws.lb.LoadBalancerAccessLogsArgs(
+        bucket=access_logs.alb_logs_bucket_name,
+        prefix=access_logs.alb_logs_prefix,
+        enabled=True,
+    ),
     tags={"Name": "appAlb"},
+    opts=ResourceOptions(depends_on=[access_logs.alb_logs_bucket_policy]),  # ALB validates write access on create
 )
 
 # ALB Target Group
@@ -88,27 +112,121 @@ alb_listener = aws.lb.Listener(
 )
 
 # ECS Task Definition
-container_definitions = json.dumps([
-    {
-        "name": "appContainer",
-        "image": "nginx",  # Replace with your application image
-        "portMappings": [
-            {
-                "containerPort": 80,
-                "protocol": "tcp"
+app_container = {
+    "name": "appContainer",
+    "image": "nginx",  # Replace with your application image
+    "portMappings": [
+        {
+            "containerPort": 80,
+            "protocol": "tcp"
+        }
+    ]
+}
+containers = [app_container]
+
+# ADOT Collector Sidecar (optional) exporting traces to X-Ray
+if tracing_enabled:
+    if adot_cpu >= app_task_cpu or adot_memory >= app_task_memory:
+        raise ValueError("adot_cpu/adot_memory must leave room for the app container within the task budget")
+    if adot_cpu < 0 or tracing_latency_threshold_ms < 0:
+        raise ValueError("adot_cpu and tracing_latency_threshold_ms must not be negative")
+    if not 0 <= tracing_sampling_percentage <= 100:
+        raise ValueError("tracing_sampling_percentage must be between 0 and 100")
+
+    # Keep every error and slow trace, sample the rest probabilistically.
+    # JSON is valid YAML, so the collector accepts this as AOT_CONFIG_CONTENT.
+    adot_collector_config = {
+        "extensions": {"health_check": {}},
+        "receivers": {
+            "otlp": {
+                "protocols": {
+                    "grpc": {"endpoint": "0.0.0.0:4317"},
+                    "http": {"endpoint": "0.0.0.0:4318"},
+                }
             }
-        ]
+        },
+        "processors": {
+            "memory_limiter": {
+                "check_interval": "1s",
+                "limit_mib": int(adot_memory * 0.8),
+                "spike_limit_mib": int(adot_memory * 0.2),
+            },
+            "tail_sampling": {
+                "decision_wait": f"{tracing_decision_wait_s}s",
+                "num_traces": tracing_num_traces,
+                "policies": [
+                    {"name": "errors", "type": "status_code", "status_code": {"status_codes": ["ERROR"]}},
+                    {"name": "slow", "type": "latency", "latency": {"threshold_ms": tracing_latency_threshold_ms}},
+                    {
+                        "name": "baseline",
+                        "type": "probabilistic",
+                        "probabilistic": {"sampling_percentage": tracing_sampling_percentage},
+                    },
+                ],
+            },
+            "batch": {"timeout": "1s"},
+        },
+        "exporters": {"awsxray": {}},
+        "service": {
+            "extensions": ["health_check"],
+            "pipelines": {
+                "traces": {
+                    "receivers": ["otlp"],
+                    "processors": ["memory_limiter", "tail_sampling", "batch"],
+                    "exporters": ["awsxray"],
+                }
+            },
+        },
     }
-])
+
+    containers.append({
+        "name": "adotCollector",
+        "image": adot_image,
+        "essential": False,  # Losing traces should not take the app down
+        "cpu": adot_cpu,
+        "memory": adot_memory,
+        "environment": [
+            {"name": "AOT_CONFIG_CONTENT", "value": json.dumps(adot_collector_config)},
+        ],
+        "healthCheck": {
+            "command": ["/healthcheck"],
+            "interval": 10,
+            "timeout": 5,
+            "retries": 3,
+            "startPeriod": 10,
+        },
+    })
+
+    # The app gets whatever is left of the task budget; tasks share localhost in awsvpc mode
+    app_container["cpu"] = app_task_cpu - adot_cpu
+    app_container["memory"] = app_task_memory - adot_memory
+    app_container["dependsOn"] = [{"containerName": "adotCollector", "condition": "START"}]
+    app_container["environment"] = [
+        {"name": "OTEL_SERVICE_NAME", "value": "appService"},
+        {"name": "OTEL_EXPORTER_OTLP_ENDPOINT", "value": "http://localhost:4318"},
+        {"name": "OTEL_EXPORTER_OTLP_PROTOCOL", "value": "http/protobuf"},
+        {"name": "OTEL_PROPAGATORS", "value": "tracecontext,baggage,xray"},
+        {"name": "OTEL_TRACES_SAMPLER", "value": "always_on"},  # Sampling is decided in the collector
+    ]
+
+    # Allow the collector to publish segments to X-Ray
+    aws.iam.RolePolicyAttachment(
+        "ecsTaskXRayPolicy",
+        role=security.ecs_task_role_name,
+        policy_arn="arn:aws:iam::aws:policy/AWSXRayDaemonWriteAccess",
+    )
+
+container_definitions = json.dumps(containers)
 
 task_definition = aws.ecs.TaskDefinition(
     "appTask",
     family="appTaskFamily",
-    cpu="256",
-    memory="512", 
+    cpu=str(app_task_cpu),
+    memory=str(app_task_memory),
     network_mode="awsvpc",
     requires_compatibilities=["FARGATE"],
     execution_role_arn=ecs_task_execution_role_arn,
+    task_role_arn=ecs_task_role_arn if tracing_enabled else None,  # Unset keeps existing task revisions unchanged
     container_definitions=container_definitions,
     tags={"Name": "appTask"},
 )
@@ -1,11 +1,12 @@
 import pulumi
 import pulumi_aws as aws
-from pulumi import export, Config, Output
+from pulumi import export, Config, Output, ResourceOptions
 import json
 
 # Dynamically import outputs from network and compute modules
 from infra import network
 from infra import compute
+from infra import assets
 
 # Retrieve network outputs
 vpc_id = network.vpc_id
@@ -21,10 +22,64 @@ ecs_task_sg_id = compute.ecs_task_sg_id
 # Pulumi Configurations
 config = Config()
 key_name = config.require("key_name")  # SSH Key Pair name
-instance_type = config.get("instance_type") or "t2.medium"  # Default instance type
-ami_id = config.get("ami_id") or "ami-0c02fb55956c7d316"  # Amazon Linux 2 AMI
+instance_type = config.get("instance_type") or "t2.medium"  # Any family, e.g. m7i.large or Graviton m7g.large
+ami_id = config.get("ami_id")  # Pin this; unset, the latest Amazon Linux 2 AMI for the architecture is used
+ebs_optimized = config.get_bool("elk_ebs_optimized")
+root_volume_size = config.get_int("elk_root_volume_size") or 20  # GiB
+delete_root_on_termination = config.get_bool("elk_delete_root_on_termination")
+data_volume_size = config.get_int("elk_data_volume_size") or 100  # GiB
+data_volume_iops = config.get_int("elk_data_volume_iops") or 3000  # gp3 baseline
+data_volume_throughput = config.get_int("elk_data_volume_throughput") or 125  # MiB/s, gp3 baseline
+protect_data_volume = config.get_bool("elk_protect_data_volume")
+retain_data_volume = config.get_bool("elk_retain_data_volume")
+data_mount_path = config.get("elk_data_mount_path") or "/var/lib/elasticsearch"
 tags = {"Environment": "dev", "Project": "monitoring-layer"}
 
+# Graviton families carry a "g" after the generation digit (t4g, m7g, c6gd, r8g, ...);
+# the first-generation Graviton family is a1
+instance_family = instance_type.split(".")[0]
+is_graviton = instance_family == "a1" or any(
+    instance_family[i].isdigit() and instance_family[i + 1] == "g" for i in range(len(instance_family) - 1)
+)
+architecture = "arm64" if is_graviton else "x86_64"
+
+# Without a pinned ami_id the AMI follows the instance architecture, so switching to or from
+# Graviton picks a matching image; a new AL2 release will also replace the node on the next deploy.
+if not ami_id:
+    ami_id = aws.ssm.get_parameter(
+        name=f"/aws/service/ami-amazon-linux-latest/amzn2-ami-hvm-{architecture}-gp2"
+    ).value
+    pulumi.log.warn(
+        f"ami_id is not set; using the latest {architecture} Amazon Linux 2 AMI ({ami_id}). "
+        "Pin it with 'pulumi config set ami_id <id>' to avoid replacing the ELK node when AWS publishes a new AMI."
+    )
+
+# t2 instances cannot be EBS-optimized; every current-generation family is by default
+if ebs_optimized is None:
+    ebs_optimized = not instance_family.startswith("t2")
+if delete_root_on_termination is None:
+    delete_root_on_termination = True
+if protect_data_volume is None:
+    protect_data_volume = True
+if retain_data_volume is None:
+    retain_data_volume = True
+
+# gp3 limits: 3000-16000 IOPS, 125-1000 MiB/s, at most 500 IOPS per GiB and 0.25 MiB/s per IOPS
+if not 3000 <= data_volume_iops <= 16000 or data_volume_iops > data_volume_size * 500:
+    raise ValueError("elk_data_volume_iops must be 3000-16000 and at most 500 per GiB of elk_data_volume_size")
+if not 125 <= data_volume_throughput <= 1000 or data_volume_throughput > data_volume_iops / 4:
+    raise ValueError("elk_data_volume_throughput must be 125-1000 MiB/s and at most 0.25 MiB/s per IOPS")
+
+# Format (only if the volume is still blank) and mount the data volume before Elasticsearch is installed.
+# Amazon Linux links /dev/sdf to the NVMe device on Nitro instances.
+data_volume_device = "/dev/sdf"
+mount_data_volume = f"""while [ ! -e {data_volume_device} ]; do sleep 1; done
+blkid {data_volume_device} || mkfs -t xfs {data_volume_device}
+mkdir -p {data_mount_path}
+echo "UUID=$(blkid -s UUID -o value {data_volume_device}) {data_mount_path} xfs defaults,noatime,nofail 0 2" >> /etc/fstab
+mount -a
+"""
+
 # Security Group for ELK Stack
 elk_sg = aws.ec2.SecurityGroup(
     "elkSecurityGroup",
@@ -90,14 +145,40 @@ elk_instance = aws.ec2.Instance(
     key_name=key_name,
     vpc_security_group_ids=[elk_sg.id],
     iam_instance_profile=instance_profile.name,
-    user_data="""
-    #!/bin/bash
-    aws s3 cp s3://elk-monitoring-setup/setup.sh /tmp/setup.sh
-    chmod +x /tmp/setup.sh
-    sleep 60
-    /tmp/setup.sh
-    """,
+    ebs_optimized=ebs_optimized,
+    root_block_device=aws.ec2.InstanceRootBlockDeviceArgs(
+        volume_type="gp3",
+        volume_size=root_volume_size,
+        encrypted=True,
+        delete_on_termination=delete_root_on_termination,
+    ),
+    user_data=assets.bootstrap_commands.apply(lambda commands: "#!/bin/bash\n" + mount_data_volume + commands),
+    user_data_replace_on_change=True,  # A new asset hash rolls the node
     tags={**tags, "Name": "elkInstance"},
+    # The data volume can only be attached to one instance, so the old node must go first
+    opts=ResourceOptions(delete_before_replace=True),
+)
+
+# Dedicated gp3 volume for Elasticsearch data, sized independently of the root disk.
+# It lives outside the instance so node replacements (e.g. a new bootstrap hash) keep the data.
+elk_data_volume = aws.ebs.Volume(
+    "elkDataVolume",
+    availability_zone=network.public_subnet_az1.availability_zone,  # Same AZ as public_subnets[0]
+    type="gp3",
+    size=data_volume_size,
+    iops=data_volume_iops,
+    throughput=data_volume_throughput,
+    encrypted=True,
+    tags={**tags, "Name": "elkDataVolume"},
+    opts=ResourceOptions(protect=protect_data_volume, retain_on_delete=retain_data_volume),
+)
+
+elk_data_volume_attachment = aws.ec2.VolumeAttachment(
+    "elkDataVolumeAttachment",
+    device_name=data_volume_device,
+    volume_id=elk_data_volume.id,
+    instance_id=elk_instance.id,
+    stop_instance_before_detaching=True,  # Let Elasticsearch flush before the volume is pulled
 )
 
 # Target Group for Kibana
@@ -152,3 +233,9 @@ aws.lb.ListenerRule(
 export("kibana_dashboard_url", Output.concat("http://", alb_dns_name, "/kibana"))
 export("elk_instance_public_ip", elk_instance.public_ip)
 export("elk_instance_domain_name", elk_instance.public_dns)
+export("elk_data_volume", {
+    "volume_id": elk_data_volume.id,
+    "size_gib": data_volume_size,
+    "iops": data_volume_iops,
+    "throughput_mibps": data_volume_throughput,
+})
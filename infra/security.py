@@ -47,6 +47,23 @@ ecs_task_execution_policy = aws.iam.RolePolicyAttachment(
     policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
 )
 
+# ECS Task Role (assumed by the running containers, e.g. the ADOT collector sidecar)
+ecs_task_role = aws.iam.Role(
+    "ecsTaskRole",
+    assume_role_policy=json.dumps({
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Action": "sts:AssumeRole",
+                "Principal": {"Service": "ecs-tasks.amazonaws.com"},
+                "Effect": "Allow",
+                "Sid": "",
+            }
+        ]
+    }),
+    tags={"Name": "ecsTaskRole"},
+)
+
 # Export Outputs
 pulumi.export("ecs_task_execution_role_arn", ecs_task_execution_role.arn)  # Export the ARN
 pulumi.export("ecs_task_execution_role", ecs_task_execution_role.name)  # Export the role name (optional)
@@ -54,4 +71,7 @@ pulumi.export("ecs_task_execution_role", ecs_task_execution_role.name)  # Export
 # Export the secret ARN for future use
 pulumi.export("generic_secret_arn", generic_secret.arn)
 # Assign `ecs_task_execution_role_arn` as a Python attribute
-ecs_task_execution_role_arn = ecs_task_execution_role.arn
\ No newline at end of file
+ecs_task_execution_role_arn = ecs_task_execution_role.arn
+# Assign `ecs_task_role` as Python attributes
+ecs_task_role_arn = ecs_task_role.arn
+ecs_task_role_name = ecs_task_role.name
@@ -0,0 +1,130 @@
+# File: policy/__main__.py
+# Run with: pulumi preview --policy-pack policy --policy-pack-config policy/config/<stack>.json
+from pulumi_policy import (
+    EnforcementLevel,
+    PolicyConfigSchema,
+    PolicyPack,
+    ResourceValidationPolicy,
+    StackValidationPolicy,
+)
+
+import rules
+
+
+def _resource_validator(check, resource_types):
+    def validate(args, report_violation):
+        if args.resource_type not in resource_types:
+            return
+        for message in check(args.props, args.get_config()):
+            report_violation(message)
+    return validate
+
+
+def _stack_validator(check):
+    def validate(args, report_violation):
+        for urn, message in check(args.resources, args.get_config()):
+            report_violation(message, urn)
+    return validate
+
+
+def _validate_burstable(args, report_violation):
+    for message in rules.check_burstable_instance(args.resource_type, args.props, args.get_config()):
+        report_violation(message)
+
+
+fargate_task_size_floor = ResourceValidationPolicy(
+    name="fargate-task-size-floor",
+    description="Fargate task definitions must reserve at least the configured CPU and memory.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    config_schema=PolicyConfigSchema(
+        properties={
+            "minCpu": {"type": "integer", "default": 512},
+            "minMemory": {"type": "integer", "default": 1024},
+        },
+    ),
+    validate=_resource_validator(rules.check_fargate_task_size, [rules.ECS_TASK_DEFINITION]),
+)
+
+ecs_service_autoscaling = StackValidationPolicy(
+    name="ecs-service-autoscaling",
+    description="ECS services behind a load balancer must have an Application Auto Scaling target with at least minCapacity tasks.",
+    enforcement_level=EnforcementLevel.MANDATORY,
+    config_schema=PolicyConfigSchema(
+        properties={
+            "minCapacity": {"type": "integer", "default": 2},
+        },
+    ),
+    validate=_stack_validator(rules.check_ecs_service_autoscaling),
+)
+
+no_burstable_instances = ResourceValidationPolicy(
+    name="no-burstable-instances",
+    description="EC2 and RDS instances must not use burstable (T-family) classes.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    config_schema=PolicyConfigSchema(
+        properties={
+            "burstableFamilies": {
+                "type": "array",
+                "items": {"type": "string"},
+                "default": ["t1", "t2", "t3", "t3a", "t4g"],
+            },
+        },
+    ),
+    validate=_validate_burstable,
+)
+
+rds_performance_insights = ResourceValidationPolicy(
+    name="rds-performance-insights",
+    description="RDS instances must enable Performance Insights.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    validate=_resource_validator(rules.check_performance_insights, [rules.RDS_INSTANCE]),
+)
+
+rds_parameter_group = ResourceValidationPolicy(
+    name="rds-parameter-group",
+    description="RDS instances must use a custom parameter group rather than the engine default.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    validate=_resource_validator(rules.check_parameter_group, [rules.RDS_INSTANCE]),
+)
+
+health_check_interval_ceiling = ResourceValidationPolicy(
+    name="health-check-interval-ceiling",
+    description="Load balancer target group health checks must run at least every N seconds.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    config_schema=PolicyConfigSchema(
+        properties={
+            "maxIntervalSeconds": {"type": "integer", "default": 15, "minimum": 5, "maximum": 300},
+        },
+    ),
+    validate=_resource_validator(rules.check_health_check_interval, list(rules.TARGET_GROUPS)),
+)
+
+private_image_pull_path = StackValidationPolicy(
+    name="private-image-pull-path",
+    description="Private ECS services need a NAT gateway or ECR/S3 VPC endpoints to pull images.",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    config_schema=PolicyConfigSchema(
+        properties={
+            "requiredEndpoints": {
+                "type": "array",
+                "items": {"type": "string"},
+                "default": ["ecr.api", "ecr.dkr", "s3"],
+            },
+        },
+    ),
+    validate=_stack_validator(rules.check_private_image_pull_path),
+)
+
+PolicyPack(
+    name="devops-task-performance",
+    enforcement_level=EnforcementLevel.ADVISORY,
+    policies=[
+        fargate_task_size_floor,
+        ecs_service_autoscaling,
+        no_burstable_instances,
+        rds_performance_insights,
+        rds_parameter_group,
+        health_check_interval_ceiling,
+        private_image_pull_path,
+    ],
+)
@@ -0,0 +1,145 @@
+# Performance checks used by the policy pack.
+# Each check takes plain resource properties (camelCase, as CrossGuard passes them)
+# plus the rule's config dict and returns a list of violation messages.
+
+ECS_TASK_DEFINITION = "aws:ecs/taskDefinition:TaskDefinition"
+ECS_SERVICE = "aws:ecs/service:Service"
+AUTOSCALING_TARGET = "aws:appautoscaling/target:Target"
+EC2_INSTANCE = "aws:ec2/instance:Instance"
+RDS_INSTANCE = "aws:rds/instance:Instance"
+TARGET_GROUPS = ("aws:lb/targetGroup:TargetGroup", "aws:alb/targetGroup:TargetGroup")
+VPC_ENDPOINT = "aws:ec2/vpcEndpoint:VpcEndpoint"
+NAT_GATEWAY = "aws:ec2/natGateway:NatGateway"
+
+
+def _as_int(value):
+    # Task definition sizes are strings; values unknown during preview are skipped
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def check_fargate_task_size(props, config):
+    if "FARGATE" not in (props.get("requiresCompatibilities") or []):
+        return []
+    violations = []
+    cpu = _as_int(props.get("cpu"))
+    memory = _as_int(props.get("memory"))
+    if cpu is not None and cpu < config["minCpu"]:
+        violations.append(f"Fargate task CPU {cpu} is below the floor of {config['minCpu']} units.")
+    if memory is not None and memory < config["minMemory"]:
+        violations.append(f"Fargate task memory {memory} MiB is below the floor of {config['minMemory']} MiB.")
+    return violations
+
+
+def check_burstable_instance(resource_type, props, config):
+    if resource_type == EC2_INSTANCE:
+        instance_type = props.get("instanceType")
+        prefix = ""
+    elif resource_type == RDS_INSTANCE:
+        instance_type = props.get("instanceClass")
+        prefix = "db."
+    else:
+        return []
+    if not isinstance(instance_type, str):
+        return []
+    family = instance_type[len(prefix):].split(".")[0] if instance_type.startswith(prefix) else ""
+    if family in config["burstableFamilies"]:
+        return [f"{instance_type} is a burstable class; CPU credits throttle sustained load. Use a fixed-performance family."]
+    return []
+
+
+def check_performance_insights(props, config):
+    if props.get("performanceInsightsEnabled") is not True:
+        return ["RDS instance does not enable Performance Insights."]
+    return []
+
+
+def check_parameter_group(props, config):
+    name = props.get("parameterGroupName")
+    if name is None or (isinstance(name, str) and name.startswith("default.")):
+        return ["RDS instance uses the engine's default parameter group; attach a tuned parameter group."]
+    return []
+
+
+def check_health_check_interval(props, config):
+    interval = _as_int((props.get("healthCheck") or {}).get("interval"))
+    if interval is None:
+        # The AWS default interval is 30 seconds
+        interval = 30
+    if interval > config["maxIntervalSeconds"]:
+        return [
+            f"Target group health check interval {interval}s exceeds {config['maxIntervalSeconds']}s; "
+            "unhealthy targets keep receiving traffic for too long."
+        ]
+    return []
+
+
+def check_ecs_service_autoscaling(resources, config):
+    """Return (urn, message) pairs for ALB-backed ECS services without an adequate autoscaling target."""
+    targets = [
+        r for r in resources
+        if r.resource_type == AUTOSCALING_TARGET
+        and r.props.get("serviceNamespace") == "ecs"
+        and r.props.get("scalableDimension") == "ecs:service:DesiredCount"
+    ]
+    violations = []
+    for service in resources:
+        if service.resource_type != ECS_SERVICE or not service.props.get("loadBalancers"):
+            continue
+        service_name = service.props.get("name")
+        service_targets = [
+            target for target in targets
+            if service.urn in [d.urn for d in (target.dependencies or [])]
+            or (
+                isinstance(service_name, str)
+                and isinstance(target.props.get("resourceId"), str)
+                and target.props["resourceId"].endswith(f"/{service_name}")
+            )
+        ]
+        if not service_targets:
+            violations.append((
+                service.urn,
+                f"ECS service '{service.name}' sits behind a load balancer but has no Application Auto Scaling "
+                "target; desired count cannot follow load.",
+            ))
+            continue
+        # Values unknown during preview are skipped
+        min_capacities = [_as_int(target.props.get("minCapacity")) for target in service_targets]
+        known = [c for c in min_capacities if c is not None]
+        if known and max(known) < config["minCapacity"]:
+            violations.append((
+                service.urn,
+                f"ECS service '{service.name}' scales down to {max(known)} task(s), below the floor of "
+                f"{config['minCapacity']}.",
+            ))
+    return violations
+
+
+def check_private_image_pull_path(resources, config):
+    """Return (urn, message) pairs for private Fargate services that cannot reach ECR."""
+    if any(r.resource_type == NAT_GATEWAY for r in resources):
+        return []
+    # "com.amazonaws.us-west-2.ecr.dkr" -> "ecr.dkr"
+    endpoint_services = {
+        r.props["serviceName"].split(".", 3)[-1]
+        for r in resources
+        if r.resource_type == VPC_ENDPOINT and isinstance(r.props.get("serviceName"), str)
+    }
+    missing = [s for s in config["requiredEndpoints"] if s not in endpoint_services]
+    if not missing:
+        return []
+    violations = []
+    for service in resources:
+        if service.resource_type != ECS_SERVICE:
+            continue
+        network = service.props.get("networkConfiguration") or {}
+        if network.get("assignPublicIp"):
+            continue
+        violations.append((
+            service.urn,
+            f"ECS service '{service.name}' runs in private subnets with no NAT gateway and no VPC endpoints for "
+            f"{', '.join(missing)}; image pulls will fail or time out.",
+        ))
+    return violations
@@ -0,0 +1,150 @@
+# Offline tests for the policy checks; no Pulumi engine required.
+import os
+import sys
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rules  # noqa: E402
+
+Resource = namedtuple("Resource", ["resource_type", "name", "urn", "props", "dependencies"])
+
+FARGATE_CONFIG = {"minCpu": 512, "minMemory": 1024}
+BURSTABLE_CONFIG = {"burstableFamilies": ["t1", "t2", "t3", "t3a", "t4g"]}
+HEALTH_CHECK_CONFIG = {"maxIntervalSeconds": 15}
+AUTOSCALING_CONFIG = {"minCapacity": 2}
+PULL_PATH_CONFIG = {"requiredEndpoints": ["ecr.api", "ecr.dkr", "s3"]}
+
+
+def _service(name="appService", urn="urn:service", public_ip=False):
+    return Resource(
+        rules.ECS_SERVICE,
+        name,
+        urn,
+        {
+            "name": f"{name}-1234",
+            "loadBalancers": [{"containerName": "appContainer", "containerPort": 80}],
+            "networkConfiguration": {"assignPublicIp": public_ip},
+        },
+        [],
+    )
+
+
+def _scaling_target(resource_id="service/appCluster/other", dependencies=(), min_capacity=2):
+    return Resource(
+        rules.AUTOSCALING_TARGET,
+        "appScalingTarget",
+        "urn:target",
+        {
+            "serviceNamespace": "ecs",
+            "scalableDimension": "ecs:service:DesiredCount",
+            "resourceId": resource_id,
+            "minCapacity": min_capacity,
+        },
+        list(dependencies),
+    )
+
+
+def _endpoint(service):
+    return Resource(rules.VPC_ENDPOINT, service, f"urn:{service}", {"serviceName": f"com.amazonaws.us-west-2.{service}"}, [])
+
+
+def test_fargate_task_size_passes_at_floor():
+    props = {"requiresCompatibilities": ["FARGATE"], "cpu": "512", "memory": "1024"}
+    assert rules.check_fargate_task_size(props, FARGATE_CONFIG) == []
+
+
+def test_fargate_task_size_flags_undersized_task():
+    props = {"requiresCompatibilities": ["FARGATE"], "cpu": "256", "memory": "512"}
+    assert len(rules.check_fargate_task_size(props, FARGATE_CONFIG)) == 2
+
+
+def test_burstable_instance_passes_fixed_performance_classes():
+    assert rules.check_burstable_instance(rules.EC2_INSTANCE, {"instanceType": "m7g.large"}, BURSTABLE_CONFIG) == []
+    assert rules.check_burstable_instance(rules.RDS_INSTANCE, {"instanceClass": "db.m7g.large"}, BURSTABLE_CONFIG) == []
+
+
+def test_burstable_instance_flags_ec2_t2():
+    assert rules.check_burstable_instance(rules.EC2_INSTANCE, {"instanceType": "t2.medium"}, BURSTABLE_CONFIG)
+
+
+def test_burstable_instance_flags_rds_t3():
+    assert rules.check_burstable_instance(rules.RDS_INSTANCE, {"instanceClass": "db.t3.micro"}, BURSTABLE_CONFIG)
+
+
+def test_performance_insights_passes_when_enabled():
+    assert rules.check_performance_insights({"performanceInsightsEnabled": True}, {}) == []
+
+
+def test_performance_insights_flags_when_missing():
+    assert rules.check_performance_insights({}, {})
+
+
+def test_parameter_group_passes_custom_group():
+    assert rules.check_parameter_group({"parameterGroupName": "postgres16-tuned"}, {}) == []
+
+
+def test_parameter_group_flags_missing_group():
+    assert rules.check_parameter_group({"parameterGroupName": None}, {})
+
+
+def test_parameter_group_flags_default_group():
+    assert rules.check_parameter_group({"parameterGroupName": "default.postgres16"}, {})
+
+
+def test_health_check_interval_passes_under_ceiling():
+    assert rules.check_health_check_interval({"healthCheck": {"interval": 10}}, HEALTH_CHECK_CONFIG) == []
+
+
+def test_health_check_interval_flags_slow_interval():
+    assert rules.check_health_check_interval({"healthCheck": {"interval": 30}}, HEALTH_CHECK_CONFIG)
+
+
+def test_health_check_interval_uses_aws_default_when_unset():
+    violations = rules.check_health_check_interval({}, HEALTH_CHECK_CONFIG)
+    assert len(violations) == 1
+    assert "30s" in violations[0]
+
+
+def test_ecs_service_autoscaling_matched_by_dependency():
+    service = _service()
+    target = _scaling_target(dependencies=[service])
+    assert rules.check_ecs_service_autoscaling([service, target], AUTOSCALING_CONFIG) == []
+
+
+def test_ecs_service_autoscaling_matched_by_resource_id():
+    service = _service()
+    target = _scaling_target(resource_id="service/appCluster/appService-1234")
+    assert rules.check_ecs_service_autoscaling([service, target], AUTOSCALING_CONFIG) == []
+
+
+def test_ecs_service_autoscaling_flags_unscaled_service():
+    service = _service()
+    violations = rules.check_ecs_service_autoscaling([service, _scaling_target()], AUTOSCALING_CONFIG)
+    assert [urn for urn, _ in violations] == [service.urn]
+
+
+def test_ecs_service_autoscaling_flags_target_below_min_capacity():
+    service = _service()
+    target = _scaling_target(dependencies=[service], min_capacity=1)
+    violations = rules.check_ecs_service_autoscaling([service, target], AUTOSCALING_CONFIG)
+    assert [urn for urn, _ in violations] == [service.urn]
+    assert "floor of 2" in violations[0][1]
+
+
+def test_private_image_pull_path_passes_with_nat_gateway():
+    nat = Resource(rules.NAT_GATEWAY, "natGateway", "urn:nat", {}, [])
+    assert rules.check_private_image_pull_path([_service(), nat], PULL_PATH_CONFIG) == []
+
+
+def test_private_image_pull_path_passes_with_all_endpoints():
+    resources = [_service(), _endpoint("ecr.api"), _endpoint("ecr.dkr"), _endpoint("s3")]
+    assert rules.check_private_image_pull_path(resources, PULL_PATH_CONFIG) == []
+
+
+def test_private_image_pull_path_flags_missing_endpoint():
+    service = _service()
+    resources = [service, _endpoint("ecr.api"), _endpoint("ecr.dkr")]
+    violations = rules.check_private_image_pull_path(resources, PULL_PATH_CONFIG)
+    assert [urn for urn, _ in violations] == [service.urn]
+    assert "s3" in violations[0][1]